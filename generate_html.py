@@ -3,27 +3,25 @@ generate_html.py  —  Stock Tracker v3
 Reads data.json + portfolio.json, writes index.html (two-page app).
 """
 
+import gzip
 import json
 from pathlib import Path
 from datetime import datetime
 
+import orjson
+
 DATA_FILE      = "data.json"
 PORTFOLIO_FILE = "portfolio.json"
 OUTPUT_FILE    = "index.html"
 
+# Also write a precompressed `index.html.gz` next to the page.  Off by default:
+# GitHub Pages compresses on the fly and won't serve it, so committing it only
+# grows history.  Enable for hosts that serve precompressed files.
+WRITE_GZIP     = False
 
-def build_html(data, portfolio):
-    stocks       = data.get("stocks", [])
-    generated_at = data.get("generated_at", "Unknown")
-    total        = data.get("total", len(stocks))
-    sectors      = sorted(set(s.get("sector") or "Unknown" for s in stocks))
-
-    sector_options = "\n".join(
-        f'<option value="{s}">{s}</option>' for s in sectors)
-
-    stocks_json    = json.dumps(stocks,    separators=(",", ":"))
-    portfolio_json = json.dumps(portfolio, separators=(",", ":"))
 
+def _html_head(generated_at, total, sector_options):
+    """Everything up to the inline data — the only part with per-run values."""
     return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -374,59 +372,62 @@ def build_html(data, portfolio):
 
 <!-- ── Scripts ─────────────────────────────────────────────────────────── -->
 <script>
-const STOCKS    = {stocks_json};
-const PORTFOLIO = {portfolio_json};
+const STOCKS    = """
 
+
+# Everything after the inline data is static, so it is encoded once at import
+# rather than rebuilt (and re-copied) on every run.
+_HTML_TAIL = """
 // ── Nav ──────────────────────────────────────────────────────────────────────
-document.querySelectorAll('.nav-tab').forEach(tab => {{
-  tab.addEventListener('click', () => {{
+document.querySelectorAll('.nav-tab').forEach(tab => {
+  tab.addEventListener('click', () => {
     document.querySelectorAll('.nav-tab').forEach(t => t.classList.remove('active'));
     document.querySelectorAll('.page').forEach(p => p.classList.remove('active'));
     tab.classList.add('active');
     document.getElementById('page-' + tab.dataset.page).classList.add('active');
     if (tab.dataset.page === 'performance') renderPerformance();
-  }});
-}});
+  });
+});
 
 // ── Helpers ──────────────────────────────────────────────────────────────────
-function parseNum(v) {{
+function parseNum(v) {
   if (v == null || v === '' || v === '—') return null;
   const n = parseFloat(String(v).replace(/[^0-9.+\u002D]/g, ''));
   return isNaN(n) ? null : n;
-}}
-function colorCls(v) {{
+}
+function colorCls(v) {
   const n = (typeof v === 'number') ? v : parseNum(v);
   if (n == null) return 'neutral';
   return n > 0 ? 'pos' : n < 0 ? 'neg' : 'neutral';
-}}
-function fmtUsd(v) {{
+}
+function fmtUsd(v) {
   if (v == null) return '—';
-  return '$' + v.toLocaleString('en-US', {{minimumFractionDigits:2,maximumFractionDigits:2}});
-}}
-function fmtPct(v, plus=true) {{
+  return '$' + v.toLocaleString('en-US', {minimumFractionDigits:2,maximumFractionDigits:2});
+}
+function fmtPct(v, plus=true) {
   if (v == null) return '—';
   return (plus && v > 0 ? '+' : '') + v.toFixed(2) + '%';
-}}
-function scoreBarColor(a) {{
+}
+function scoreBarColor(a) {
   if (a == null) return '#ccc8c0';
   if (a>=78) return '#1a1a1a';
   if (a>=65) return '#3d3d3d';
   if (a>=52) return '#c41e3a';
   if (a>=38) return '#e8794a';
   return '#aaaaaa';
-}}
-function scoreBar(avg) {{
+}
+function scoreBar(avg) {
   if (avg == null) return `<td class="neutral">—</td>`;
   const pct = Math.round(avg);   // already 0-100
   const col = scoreBarColor(avg);
-  return `<td><div class="scbar"><span style="color:${{col}};font-size:11px">${{avg.toFixed(1)}}</span><div class="scbar-wrap"><div class="scbar-fill" style="width:${{pct}}%;background:${{col}}"></div></div></div></td>`;
-}}
-function cell(v, color=false, sec=false) {{
+  return `<td><div class="scbar"><span style="color:${col};font-size:11px">${avg.toFixed(1)}</span><div class="scbar-wrap"><div class="scbar-fill" style="width:${pct}%;background:${col}"></div></div></div></td>`;
+}
+function cell(v, color=false, sec=false) {
   const val = (v != null && v !== '') ? v : '—';
   const cls = color ? colorCls(v) : '';
   const s   = sec ? ' sec' : '';
-  return `<td class="${{cls}}${{s}}">${{val}}</td>`;
-}}
+  return `<td class="${cls}${s}">${val}</td>`;
+}
 
 // ════════════════════════════════════════════════════════════════════════════
 // STOCK DATA TABLE
@@ -439,98 +440,114 @@ const NUM_COLS = new Set([
 ]);
 
 let sortCol='overall', sortDir='desc';
-let filterGrade='', filterSector='', filterSearch='';
-
-function extractSort(s, col) {{
-  const raw = s[col];
-  if (NUM_COLS.has(col)) {{
-    const n = (typeof raw==='number') ? raw : parseNum(raw);
-    return n ?? (sortDir==='asc' ? Infinity : -Infinity);
-  }}
-  return String(raw??'').toLowerCase();
-}}
-
-function applySort(data) {{
-  return [...data].sort((a,b) => {{
-    const av=extractSort(a,sortCol), bv=extractSort(b,sortCol);
-    if (av<bv) return sortDir==='asc'?-1:1;
-    if (av>bv) return sortDir==='asc'?1:-1;
+let filterGrade='', filterSector='', filterSearch='';   // filterSearch is lower-cased
+
+// Per-row keys built once here rather than per row per keystroke / per sort
+// comparison: lower-cased search fields and parsed numeric sort values
+// (display strings like "+12.3%" are parsed a single time).
+STOCKS.forEach(s => {
+  s._ticker = (s.ticker||'').toLowerCase();
+  s._name   = (s.name||'').toLowerCase();
+  s._num    = {};
+  for (const c of NUM_COLS) s._num[c] = (typeof s[c]==='number') ? s[c] : parseNum(s[c]);
+});
+
+function extractSort(s, col) {
+  if (NUM_COLS.has(col)) return s._num[col] ?? (sortDir==='asc' ? Infinity : -Infinity);
+  return String(s[col]??'').toLowerCase();
+}
+
+function applySort(data) {
+  // Decorate–sort–undecorate: one key per row per sort, not two per comparison
+  const keyed = data.map(s => [extractSort(s,sortCol), s]);
+  keyed.sort((a,b) => {
+    if (a[0]<b[0]) return sortDir==='asc'?-1:1;
+    if (a[0]>b[0]) return sortDir==='asc'?1:-1;
     return 0;
-  }});
-}}
+  });
+  return keyed.map(k => k[1]);
+}
 
-function applyFilters() {{
+function applyFilters() {
   let d = STOCKS;
-  if (filterSearch) {{
-    const q=filterSearch.toLowerCase();
-    d=d.filter(s=>(s.ticker||'').toLowerCase().includes(q)||(s.name||'').toLowerCase().includes(q));
-  }}
+  if (filterSearch) {
+    const q=filterSearch;
+    d=d.filter(s=>s._ticker.includes(q)||s._name.includes(q));
+  }
   if (filterSector) d=d.filter(s=>s.sector===filterSector);
   if (filterGrade)  d=d.filter(s=>s.grade===filterGrade);
   renderStockTable(applySort(d));
-}}
-
-function renderStockTable(data) {{
+}
+
+// Row markup depends only on the stock itself, never on sort or filter state,
+// so it is built once per stock and cached; re-renders just join the cached
+// strings and write the tbody in a single assignment.
+function stockRow(s) {
+  if (s._row == null) s._row = `<tr>
+    <td class="c-ticker">${s.ticker}</td>
+    <td class="c-name" title="${s.name||''}">${s.name||'—'}</td>
+    <td class="sec"><span class="gb ${s.grade_color||''}">${s.grade||'—'}</span></td>
+    ${scoreBar(s.overall)}
+    <td class="sec"><span class="spill">${s.sector||'—'}</span></td>
+    ${cell(s.market_cap)}
+    ${cell(s.price)}
+    ${cell(s.perf_52w,true)}
+    ${cell(s.rev_growth_ttm,true,true)}
+    ${cell(s.eps_growth_ttm,true)}
+    ${cell(s.rev_accel,true)}
+    ${cell(s.eps_accel,true)}
+    ${cell(s.earnings_surprise,true)}
+    ${cell(s.forward_pe,false,true)}
+    ${cell(s.peg_ratio)}
+    ${cell(s.ev_ebitda)}
+    ${cell(s.price_sales)}
+    ${cell(s.gross_margin,true,true)}
+    ${cell(s.operating_margin,true)}
+    ${cell(s.roe,true)}
+    ${cell(s.roa,true)}
+    ${cell(s.debt_equity)}
+    ${cell(s.analyst_upside,true,true)}
+    ${cell(s.analyst_rec_label)}
+    ${cell(s.target_price)}
+    ${cell(s.next_earnings)}
+  </tr>`;
+  return s._row;
+}
+
+function renderStockTable(data) {
   const tbody = document.getElementById('tbl-body');
-  if (!data.length) {{
+  if (!data.length) {
     tbody.innerHTML=`<tr><td colspan="26" class="empty"><span>∅</span>No results.</td></tr>`;
     return;
-  }}
-  tbody.innerHTML = data.map(s => `<tr>
-    <td class="c-ticker">${{s.ticker}}</td>
-    <td class="c-name" title="${{s.name||''}}">${{s.name||'—'}}</td>
-    <td class="sec"><span class="gb ${{s.grade_color||''}}">${{s.grade||'—'}}</span></td>
-    ${{scoreBar(s.overall)}}
-    <td class="sec"><span class="spill">${{s.sector||'—'}}</span></td>
-    ${{cell(s.market_cap)}}
-    ${{cell(s.price)}}
-    ${{cell(s.perf_52w,true)}}
-    ${{cell(s.rev_growth_ttm,true,true)}}
-    ${{cell(s.eps_growth_ttm,true)}}
-    ${{cell(s.rev_accel,true)}}
-    ${{cell(s.eps_accel,true)}}
-    ${{cell(s.earnings_surprise,true)}}
-    ${{cell(s.forward_pe,false,true)}}
-    ${{cell(s.peg_ratio)}}
-    ${{cell(s.ev_ebitda)}}
-    ${{cell(s.price_sales)}}
-    ${{cell(s.gross_margin,true,true)}}
-    ${{cell(s.operating_margin,true)}}
-    ${{cell(s.roe,true)}}
-    ${{cell(s.roa,true)}}
-    ${{cell(s.debt_equity)}}
-    ${{cell(s.analyst_upside,true,true)}}
-    ${{cell(s.analyst_rec_label)}}
-    ${{cell(s.target_price)}}
-    ${{cell(s.next_earnings)}}
-  </tr>`).join('');
+  }
+  tbody.innerHTML = data.map(stockRow).join('');
   document.getElementById('visible-count').textContent = data.length.toLocaleString();
   document.getElementById('footer-count').textContent  =
-    `Showing ${{data.length.toLocaleString()}} of ${{STOCKS.length.toLocaleString()}}`;
-}}
+    `Showing ${data.length.toLocaleString()} of ${STOCKS.length.toLocaleString()}`;
+}
 
 // Sort click
-document.querySelectorAll('#stock-table th[data-col]').forEach(th => {{
-  th.addEventListener('click', () => {{
+document.querySelectorAll('#stock-table th[data-col]').forEach(th => {
+  th.addEventListener('click', () => {
     const col=th.dataset.col;
     sortDir = sortCol===col ? (sortDir==='asc'?'desc':'asc') : (NUM_COLS.has(col)?'desc':'asc');
     sortCol = col;
     document.querySelectorAll('#stock-table th').forEach(t=>t.classList.remove('sorted-asc','sorted-desc'));
     th.classList.add(sortDir==='asc'?'sorted-asc':'sorted-desc');
     applyFilters();
-  }});
-}});
+  });
+});
 
-document.getElementById('search').addEventListener('input', e => {{ filterSearch=e.target.value.trim(); applyFilters(); }});
-document.getElementById('sector-filter').addEventListener('change', e => {{ filterSector=e.target.value; applyFilters(); }});
-document.querySelectorAll('#grade-filter .btn').forEach(btn => {{
-  btn.addEventListener('click', () => {{
+document.getElementById('search').addEventListener('input', e => { filterSearch=e.target.value.trim().toLowerCase(); applyFilters(); });
+document.getElementById('sector-filter').addEventListener('change', e => { filterSector=e.target.value; applyFilters(); });
+document.querySelectorAll('#grade-filter .btn').forEach(btn => {
+  btn.addEventListener('click', () => {
     document.querySelectorAll('#grade-filter .btn').forEach(b=>b.classList.remove('active'));
     btn.classList.add('active');
     filterGrade=btn.dataset.grade;
     applyFilters();
-  }});
-}});
+  });
+});
 
 document.querySelector('#stock-table th[data-col="overall"]')?.classList.add('sorted-desc');
 applyFilters();
@@ -540,17 +557,17 @@ applyFilters();
 // ════════════════════════════════════════════════════════════════════════════
 let perfChartInstance = null;
 
-function renderPerformance() {{
-  if (!PORTFOLIO || !PORTFOLIO.start_date) {{
+function renderPerformance() {
+  if (!PORTFOLIO || !PORTFOLIO.start_date) {
     document.getElementById('kpi-value').textContent = 'No data';
     return;
-  }}
+  }
 
   const P         = PORTFOLIO;
   const startVal  = P.start_value || 1000000;
   const curVal    = P.total_value || startVal;
   const totalRet  = (curVal - startVal) / startVal * 100;
-  const holdings  = P.holdings  || {{}};
+  const holdings  = P.holdings  || {};
   const trades    = P.trades    || [];
   const history   = P.history   || [];
   const spyHist   = P.spy_history || [];
@@ -561,24 +578,24 @@ function renderPerformance() {{
   document.getElementById('kpi-value').className     = 'kpi-value ' + (totalRet>=0?'pos':'neg');
   document.getElementById('kpi-return').textContent  = fmtPct(totalRet);
   document.getElementById('kpi-return').className    = 'kpi-value ' + (totalRet>=0?'pos':'neg');
-  document.getElementById('kpi-gain').textContent    = `${{fmtUsd(curVal-startVal)}} gain`;
+  document.getElementById('kpi-gain').textContent    = `${fmtUsd(curVal-startVal)} gain`;
   document.getElementById('kpi-holdings').textContent= Object.keys(holdings).length;
   document.getElementById('kpi-cash').textContent    = 'Cash: ' + fmtUsd(P.cash);
   document.getElementById('kpi-trades').textContent  = trades.length;
   document.getElementById('kpi-updated').textContent = 'Updated: ' + (P.updated_at||'—');
 
   // SPY return for comparison
-  if (spyHist.length >= 2) {{
+  if (spyHist.length >= 2) {
     const spyStart = spyHist[0].value;
     const spyEnd   = spyHist[spyHist.length-1].value;
     const spyRet   = (spyEnd - spyStart) / spyStart * 100;
     const diff     = totalRet - spyRet;
     document.getElementById('kpi-vs-spy').textContent =
-      `vs S&P 500: ${{fmtPct(spyRet)}} (${{diff>=0?'+':''}}${{diff.toFixed(2)}}pp)`;
-  }}
+      `vs S&P 500: ${fmtPct(spyRet)} (${diff>=0?'+':''}${diff.toFixed(2)}pp)`;
+  }
 
   document.getElementById('port-footer-updated').textContent =
-    `Portfolio updated ${{P.updated_at||'—'}}`;
+    `Portfolio updated ${P.updated_at||'—'}`;
 
   // ── Chart ──────────────────────────────────────────────────────────────
   // Merge portfolio history and SPY history onto common dates
@@ -594,12 +611,12 @@ function renderPerformance() {{
 
   const ctx = document.getElementById('perf-chart').getContext('2d');
   if (perfChartInstance) perfChartInstance.destroy();
-  perfChartInstance = new Chart(ctx, {{
+  perfChartInstance = new Chart(ctx, {
     type: 'line',
-    data: {{
+    data: {
       labels: allDates,
       datasets: [
-        {{
+        {
           label: 'Portfolio',
           data: portVals,
           borderColor: '#1a1a1a',
@@ -610,8 +627,8 @@ function renderPerformance() {{
           tension: 0.3,
           fill: true,
           spanGaps: true,
-        }},
-        {{
+        },
+        {
           label: 'S&P 500',
           data: spyVals,
           borderColor: '#c41e3a',
@@ -622,71 +639,71 @@ function renderPerformance() {{
           tension: 0.3,
           fill: true,
           spanGaps: true,
-        }},
+        },
       ]
-    }},
-    options: {{
+    },
+    options: {
       responsive: true,
       maintainAspectRatio: false,
-      interaction: {{ mode:'index', intersect:false }},
-      plugins: {{
-        legend: {{ display:false }},
-        tooltip: {{
+      interaction: { mode:'index', intersect:false },
+      plugins: {
+        legend: { display:false },
+        tooltip: {
           backgroundColor: '#ffffff',
           borderColor: '#1a1a1a',
           borderWidth: 1,
           titleColor: '#1a1a1a',
           bodyColor: '#555550',
-          titleFont: {{ family:"'IBM Plex Mono',monospace", size:11 }},
-          bodyFont:  {{ family:"'IBM Plex Mono',monospace", size:11 }},
-          callbacks: {{
-            label: ctx => `${{ctx.dataset.label}}: ${{ctx.parsed.y!=null?fmtPct(ctx.parsed.y):'—'}}`
-          }}
-        }}
-      }},
-      scales: {{
-        x: {{
-          grid: {{ color:'rgba(224,220,212,0.8)' }},
-          ticks: {{ color:'#888880', font:{{family:"'IBM Plex Mono',monospace",size:10}},
-                   maxTicksLimit:12, maxRotation:0 }}
-        }},
-        y: {{
-          grid: {{ color:'rgba(224,220,212,0.8)' }},
-          ticks: {{
+          titleFont: { family:"'IBM Plex Mono',monospace", size:11 },
+          bodyFont:  { family:"'IBM Plex Mono',monospace", size:11 },
+          callbacks: {
+            label: ctx => `${ctx.dataset.label}: ${ctx.parsed.y!=null?fmtPct(ctx.parsed.y):'—'}`
+          }
+        }
+      },
+      scales: {
+        x: {
+          grid: { color:'rgba(224,220,212,0.8)' },
+          ticks: { color:'#888880', font:{family:"'IBM Plex Mono',monospace",size:10},
+                   maxTicksLimit:12, maxRotation:0 }
+        },
+        y: {
+          grid: { color:'rgba(224,220,212,0.8)' },
+          ticks: {
             color:'#888880',
-            font:{{family:"'IBM Plex Mono',monospace",size:10}},
+            font:{family:"'IBM Plex Mono',monospace",size:10},
             callback: v => (v>=0?'+':'')+v.toFixed(1)+'%'
-          }}
-        }}
-      }}
-    }}
-  }});
+          }
+        }
+      }
+    }
+  });
 
   // ── Holdings table (sortable) ──────────────────────────────────────────
   const stockMap = Object.fromEntries(STOCKS.map(s=>[s.ticker,s]));
 
   // Mirror grader.py _target_weights(): top MAX_HOLDINGS picks, score-weighted
-  function computeTargetWeights(stocks) {{
+  function computeTargetWeights(stocks) {
     const CONV = 1.5, MAX_P = 0.10, MIN_P = 0.015, MAX_H = 25;
     const elig = stocks
       .filter(s => (s.overall||0) >= 65 && s.price_raw > 0)
       .sort((a,b) => (b.overall||0) - (a.overall||0))
       .slice(0, MAX_H);
-    if (!elig.length) return {{}};
-    const raw = {{}};
-    elig.forEach(s => {{ raw[s.ticker] = Math.pow(s.overall, CONV); }});
+    if (!elig.length) return {};
+    const raw = {};
+    elig.forEach(s => { raw[s.ticker] = Math.pow(s.overall, CONV); });
     const tot = Object.values(raw).reduce((a,b)=>a+b,0) || 1;
-    const w = {{}};
+    const w = {};
     for (const [t,v] of Object.entries(raw)) w[t] = Math.max(MIN_P, Math.min(MAX_P, v/tot));
     const totW = Object.values(w).reduce((a,b)=>a+b,0) || 1;
     for (const t in w) w[t] /= totW;
     return w;
-  }}
+  }
   const targetW = computeTargetWeights(STOCKS);
 
   // Build enriched array once; sort + re-render on demand
-  const holdArr = Object.entries(holdings).map(([ticker,pos]) => {{
-    const st       = stockMap[ticker] || {{}};
+  const holdArr = Object.entries(holdings).map(([ticker,pos]) => {
+    const st       = stockMap[ticker] || {};
     const curPrice = pos.last_price || pos.cost_basis;
     const mv       = pos.shares * curPrice;
     const gainUsd  = pos.shares * (curPrice - pos.cost_basis);
@@ -696,16 +713,16 @@ function renderPerformance() {{
     const drift    = target != null ? weight - target : null;
     const daysHeld = pos.bought_date
       ? Math.floor((Date.now() - new Date(pos.bought_date)) / 86400000) : null;
-    return {{ ticker, pos, st, curPrice, mv, gainUsd, gainPct,
-              weight, target, drift, daysHeld }};
-  }});
+    return { ticker, pos, st, curPrice, mv, gainUsd, gainPct,
+              weight, target, drift, daysHeld };
+  });
 
   const H_NUM = new Set(['overall','shares','cost_basis','last_price','mkt_value',
                          'gain_pct','gain_usd','weight','target','drift','days_held']);
   let hSortCol = 'mkt_value', hSortDir = 'desc';
 
-  function hExtract(h, col) {{
-    const map = {{
+  function hExtract(h, col) {
+    const map = {
       ticker:     h.ticker,
       name:       h.st.name || '',
       sector:     h.st.sector || '',
@@ -722,78 +739,78 @@ function renderPerformance() {{
       drift:      h.drift,
       days_held:  h.daysHeld,
       bought_date:h.pos.bought_date || '',
-    }};
+    };
     const v = map[col];
     if (H_NUM.has(col)) return v ?? (hSortDir==='asc' ? Infinity : -Infinity);
     return String(v ?? '').toLowerCase();
-  }}
+  }
 
-  function renderHoldings() {{
-    const sorted = [...holdArr].sort((a,b) => {{
+  function renderHoldings() {
+    const sorted = [...holdArr].sort((a,b) => {
       const av = hExtract(a, hSortCol), bv = hExtract(b, hSortCol);
       if (av < bv) return hSortDir==='asc' ? -1 : 1;
       if (av > bv) return hSortDir==='asc' ?  1 : -1;
       return 0;
-    }});
+    });
 
     document.querySelectorAll('#holdings-table th').forEach(t =>
       t.classList.remove('sorted-asc','sorted-desc'));
     const activeHth = document.querySelector(
-      `#holdings-table th[data-col="${{hSortCol}}"]`);
+      `#holdings-table th[data-col="${hSortCol}"]`);
     if (activeHth) activeHth.classList.add(
       hSortDir==='asc' ? 'sorted-asc' : 'sorted-desc');
 
     const hbody = document.getElementById('holdings-body');
-    if (!sorted.length) {{
+    if (!sorted.length) {
       hbody.innerHTML = `<tr><td colspan="16" class="empty"><span>—</span>No current holdings</td></tr>`;
       return;
-    }}
-    hbody.innerHTML = sorted.map(h => {{
+    }
+    hbody.innerHTML = sorted.map(h => {
       const driftCls  = h.drift == null ? '' : h.drift > 3 ? 'neg' : h.drift < -3 ? 'pos' : 'neutral';
       const driftStr  = h.drift  != null ? (h.drift>=0?'+':'')+h.drift.toFixed(1)+'pp' : '—';
       const targetStr = h.target != null ? h.target.toFixed(1)+'%' : '—';
       const daysStr   = h.daysHeld != null ? h.daysHeld+'d' : '—';
       const daysCls   = h.daysHeld != null && h.daysHeld < 365 ? 'neutral' : '';
       return `<tr>
-        <td class="c-ticker">${{h.ticker}}</td>
-        <td class="c-name" title="${{h.st.name||''}}">${{h.st.name||'—'}}</td>
-        <td><span class="spill">${{h.st.sector||'—'}}</span></td>
-        <td class="sec"><span class="gb ${{h.st.grade_color||''}}">${{h.st.grade||'—'}}</span></td>
-        ${{scoreBar(h.st.overall)}}
-        <td class="sec">${{h.pos.shares.toFixed(4)}}</td>
-        <td>${{h.pos.cost_basis.toFixed(2)}}</td>
-        <td>${{h.curPrice.toFixed(2)}}</td>
-        <td>${{fmtUsd(h.mv)}}</td>
-        <td class="${{h.gainPct>=0?'pos':'neg'}}">${{fmtPct(h.gainPct)}}</td>
-        <td class="${{h.gainUsd>=0?'pos':'neg'}}">${{fmtUsd(h.gainUsd)}}</td>
-        <td>${{h.weight.toFixed(1)}}%</td>
-        <td>${{targetStr}}</td>
-        <td class="${{driftCls}}">${{driftStr}}</td>
-        <td class="${{daysCls}}">${{daysStr}}</td>
-        <td>${{h.pos.bought_date||'—'}}</td>
+        <td class="c-ticker">${h.ticker}</td>
+        <td class="c-name" title="${h.st.name||''}">${h.st.name||'—'}</td>
+        <td><span class="spill">${h.st.sector||'—'}</span></td>
+        <td class="sec"><span class="gb ${h.st.grade_color||''}">${h.st.grade||'—'}</span></td>
+        ${scoreBar(h.st.overall)}
+        <td class="sec">${h.pos.shares.toFixed(4)}</td>
+        <td>${h.pos.cost_basis.toFixed(2)}</td>
+        <td>${h.curPrice.toFixed(2)}</td>
+        <td>${fmtUsd(h.mv)}</td>
+        <td class="${h.gainPct>=0?'pos':'neg'}">${fmtPct(h.gainPct)}</td>
+        <td class="${h.gainUsd>=0?'pos':'neg'}">${fmtUsd(h.gainUsd)}</td>
+        <td>${h.weight.toFixed(1)}%</td>
+        <td>${targetStr}</td>
+        <td class="${driftCls}">${driftStr}</td>
+        <td class="${daysCls}">${daysStr}</td>
+        <td>${h.pos.bought_date||'—'}</td>
       </tr>`;
-    }}).join('');
-  }}
+    }).join('');
+  }
 
-  document.querySelectorAll('#holdings-table th[data-col]').forEach(th => {{
-    th.addEventListener('click', () => {{
+  document.querySelectorAll('#holdings-table th[data-col]').forEach(th => {
+    th.addEventListener('click', () => {
       const col = th.dataset.col;
       hSortDir = hSortCol === col ? (hSortDir==='asc'?'desc':'asc')
                                   : (H_NUM.has(col) ? 'desc' : 'asc');
       hSortCol = col;
       renderHoldings();
-    }});
-  }});
+    });
+  });
 
   renderHoldings();
 
   // ── Trade history ──────────────────────────────────────────────────────
   const tbody = document.getElementById('trades-body');
   const tradesSorted = [...trades].reverse();
-  if (!tradesSorted.length) {{
+  if (!tradesSorted.length) {
     tbody.innerHTML=`<tr><td colspan="7" class="empty"><span>—</span>No trades yet</td></tr>`;
-  }} else {{
-    tbody.innerHTML = tradesSorted.map(t => {{
+  } else {
+    tbody.innerHTML = tradesSorted.map(t => {
       const isBuy  = t.action==='BUY' || t.action==='TOP';
       const isTrim = t.action==='TRIM';
       const val    = isBuy ? t.cost : t.proceeds;
@@ -802,20 +819,59 @@ function renderPerformance() {{
       const acColor= isBuy ? 'var(--pos)' : isTrim ? '#b05800' : 'var(--neg)';
       const acLabel= t.action;
       return `<tr>
-        <td>${{t.date}}</td>
-        <td style="color:${{acColor}};font-weight:700">${{acLabel}}</td>
-        <td class="c-ticker">${{t.ticker}}</td>
-        <td>${{t.shares.toFixed(4)}}</td>
-        <td>${{t.price.toFixed(2)}}</td>
-        <td>${{fmtUsd(val)}}</td>
-        <td class="${{gainCls}}">${{gainPct}}</td>
+        <td>${t.date}</td>
+        <td style="color:${acColor};font-weight:700">${acLabel}</td>
+        <td class="c-ticker">${t.ticker}</td>
+        <td>${t.shares.toFixed(4)}</td>
+        <td>${t.price.toFixed(2)}</td>
+        <td>${fmtUsd(val)}</td>
+        <td class="${gainCls}">${gainPct}</td>
       </tr>`;
-    }}).join('');
-  }}
-}}
+    }).join('');
+  }
+}
 </script>
 </body>
-</html>"""
+</html>""".encode("utf-8")
+
+
+def write_html(data, portfolio, path):
+    """
+    Stream index.html to `path`: header, STOCKS JSON, PORTFOLIO JSON, static
+    tail.  Each piece is written straight to the file, so the full page never
+    has to exist as one string in memory.  With WRITE_GZIP the same chunks also
+    go to `path`.gz.  Returns the number of HTML bytes written.
+    """
+    stocks       = data.get("stocks", [])
+    generated_at = data.get("generated_at", "Unknown")
+    total        = data.get("total", len(stocks))
+    sectors      = sorted(set(s.get("sector") or "Unknown" for s in stocks))
+
+    sector_options = "\n".join(
+        f'<option value="{s}">{s}</option>' for s in sectors)
+
+    # mtime=0 keeps the .gz byte-identical when the page hasn't changed.
+    gz = (gzip.GzipFile(f"{path}.gz", "wb", compresslevel=9, mtime=0)
+          if WRITE_GZIP else None)
+    try:
+        with open(path, "wb") as f:
+            def write(chunk):
+                f.write(chunk)
+                if gz is not None:
+                    gz.write(chunk)
+
+            write(_html_head(generated_at, total, sector_options).encode("utf-8"))
+            # orjson emits compact UTF-8 bytes directly — the stocks blob is the
+            # bulk of the page and goes to disk without an intermediate str.
+            write(orjson.dumps(stocks))
+            write(b";\nconst PORTFOLIO = ")
+            write(orjson.dumps(portfolio))
+            write(b";\n")
+            write(_HTML_TAIL)
+            return f.tell()
+    finally:
+        if gz is not None:
+            gz.close()
 
 
 def main():
@@ -827,21 +883,25 @@ def main():
         return
 
     print(f"Reading {DATA_FILE}...")
-    data = json.loads(data_path.read_text())
+    data = orjson.loads(data_path.read_bytes())
     print(f"  {data.get('total','?')} stocks, generated {data.get('generated_at','?')}")
 
     portfolio = {}
     if port_path.exists():
         print(f"Reading {PORTFOLIO_FILE}...")
+        # portfolio.json is written with stdlib json by every script that
+        # touches it and can carry a bare NaN, which orjson rejects.
         portfolio = json.loads(port_path.read_text())
         print(f"  Portfolio value: ${portfolio.get('total_value',0):,.0f} | "
               f"{len(portfolio.get('holdings',{}))} holdings")
     else:
         print(f"  No {PORTFOLIO_FILE} found — portfolio section will be empty until scraper runs")
 
-    html = build_html(data, portfolio)
-    Path(OUTPUT_FILE).write_text(html, encoding="utf-8")
-    print(f"Written {OUTPUT_FILE} ({len(html):,} bytes)")
+    size = write_html(data, portfolio, OUTPUT_FILE)
+    print(f"Written {OUTPUT_FILE} ({size:,} bytes)")
+    if WRITE_GZIP:
+        print(f"Written {OUTPUT_FILE}.gz "
+              f"({Path(OUTPUT_FILE + '.gz').stat().st_size:,} bytes)")
 
 
 if __name__ == "__main__":
@@ -16,6 +16,9 @@ import math
 from datetime import date
 from pathlib import Path
 
+import numpy as np
+import orjson
+
 RAW_FILE       = "raw_data.json"
 OUTPUT_FILE    = "data.json"
 PORTFOLIO_FILE = "portfolio.json"
@@ -66,26 +69,37 @@ FINANCIALS_SECTORS = {"Financial Services", "Financials"}
 UTILITIES_SECTORS  = {"Utilities"}
 
 
-def _interp(value, anchors):
+def _to_float(value):
+    """Raw metric → float; None and non-numeric values become NaN."""
+    try:
+        return float(value) if value is not None else math.nan
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _interp_column(values, anchors):
     """
-    Map a raw value to 0–100 using (raw_value, score) anchor pairs.
-    Anchors must be sorted ascending by raw_value.
-    Clamps to the first/last score outside the anchor range.
-    Returns None if value is None.
+    Map a whole column of raw values to 0–100 using (raw_value, score) anchor
+    pairs, in one vectorised pass.  Anchors must be sorted ascending by
+    raw_value.  Clamps to the first/last score outside the anchor range;
+    inside it, interpolates on the segment containing the value and rounds
+    to 1 dp.  None / NaN values map to None.
     """
-    if value is None:
-        return None
-    if value <= anchors[0][0]:
-        return float(anchors[0][1])
-    if value >= anchors[-1][0]:
-        return float(anchors[-1][1])
-    for i in range(len(anchors) - 1):
-        lo_v, lo_s = anchors[i]
-        hi_v, hi_s = anchors[i + 1]
-        if lo_v <= value <= hi_v:
-            t = (value - lo_v) / (hi_v - lo_v)
-            return round(lo_s + t * (hi_s - lo_s), 1)
-    return None
+    v  = np.array([_to_float(x) for x in values], dtype=float)
+    xs = np.array([a[0] for a in anchors], dtype=float)
+    ys = np.array([a[1] for a in anchors], dtype=float)
+
+    # Segment j-1 → j is the first one whose upper bound is >= value
+    j = np.clip(np.searchsorted(xs, v, side="left"), 1, len(xs) - 1)
+    lo_v, hi_v = xs[j - 1], xs[j]
+    lo_s, hi_s = ys[j - 1], ys[j]
+    with np.errstate(invalid="ignore"):
+        t   = (v - lo_v) / (hi_v - lo_v)
+        out = lo_s + t * (hi_s - lo_s)
+        out = np.where(v <= xs[0], ys[0], np.where(v >= xs[-1], ys[-1], out))
+
+    # Python round() per element keeps results identical to scalar rounding
+    return [None if x != x else round(x, 1) for x in out.tolist()]
 
 
 def _wavg(pairs):
@@ -170,18 +184,53 @@ A_UPSIDE     = [(-25,3),(-5,22),(0,38),(5,50),(12,62),(22,76),(35,88),(55,100)]
 A_REC_INV    = [(1.0,100),(1.5,88),(2.0,72),(2.5,55),(3.0,35),(3.5,18),(4.0,8),(5.0,0)]
 
 
-def score_record(raw):
+# Raw field → anchor table for every interpolated metric
+METRIC_ANCHORS = {
+    "rev_growth_ttm":    A_REV_GROWTH,
+    "eps_growth_ttm":    A_EPS_GROWTH,
+    "rev_accel":         A_REV_ACCEL,
+    "eps_accel":         A_EPS_ACCEL,
+    "earnings_surprise": A_SURPRISE,
+    "gross_margin":      A_GROSS_MGN,
+    "operating_margin":  A_OP_MGN,
+    "roe":               A_ROE,
+    "roa":               A_ROA,
+    "debt_equity":       A_DE_INV,
+    "peg_ratio":         A_PEG_INV,
+    "forward_pe":        A_FWD_PE_INV,
+    "ev_ebitda":         A_EV_INV,
+    "price_sales":       A_PS_INV,
+    "perf_52w":          A_PERF_52W,
+    "analyst_upside":    A_UPSIDE,
+    "analyst_rec":       A_REC_INV,
+}
+
+
+def score_metrics(raws):
+    """
+    Per-metric 0–100 scores for every record, computed column-wise (one
+    vectorised interpolation per metric rather than one Python call per
+    metric per stock).  Returns one {metric: score} dict per record.
+    """
+    cols = {k: _interp_column([r.get(k) for r in raws], anchors)
+            for k, anchors in METRIC_ANCHORS.items()}
+    return [{k: col[i] for k, col in cols.items()} for i in range(len(raws))]
+
+
+def score_record(raw, m):
+    """Roll one record's metric scores `m` (from score_metrics) up into
+    category scores, the overall score and a letter grade."""
     sector  = raw.get("sector", "")
     is_fin  = sector in FINANCIALS_SECTORS
     is_util = sector in UTILITIES_SECTORS
     s = {}
 
     # ── Growth (45%) ──────────────────────────────────────────────────────
-    s["rev_growth_ttm"]    = _interp(raw.get("rev_growth_ttm"),    A_REV_GROWTH)
-    s["eps_growth_ttm"]    = _interp(raw.get("eps_growth_ttm"),    A_EPS_GROWTH)
-    s["rev_accel"]         = _interp(raw.get("rev_accel"),         A_REV_ACCEL)
-    s["eps_accel"]         = _interp(raw.get("eps_accel"),         A_EPS_ACCEL)
-    s["earnings_surprise"] = _interp(raw.get("earnings_surprise"), A_SURPRISE)
+    s["rev_growth_ttm"]    = m["rev_growth_ttm"]
+    s["eps_growth_ttm"]    = m["eps_growth_ttm"]
+    s["rev_accel"]         = m["rev_accel"]
+    s["eps_accel"]         = m["eps_accel"]
+    s["earnings_surprise"] = m["earnings_surprise"]
     s["growth"] = _wavg([
         (s["eps_growth_ttm"],    0.36),   # EPS growth leads — operating leverage matters
         (s["rev_growth_ttm"],    0.28),   # revenue growth still core signal
@@ -191,11 +240,11 @@ def score_record(raw):
     ])
 
     # ── Quality (30%) ─────────────────────────────────────────────────────
-    s["gross_margin"]     = _interp(raw.get("gross_margin"),     A_GROSS_MGN)
-    s["operating_margin"] = _interp(raw.get("operating_margin"), A_OP_MGN)
-    s["roe"]              = _interp(raw.get("roe"),              A_ROE)
-    s["roa"]              = _interp(raw.get("roa"),              A_ROA)
-    s["debt_equity"]      = None if (is_fin or is_util) else                             _interp(raw.get("debt_equity"),      A_DE_INV)
+    s["gross_margin"]     = m["gross_margin"]
+    s["operating_margin"] = m["operating_margin"]
+    s["roe"]              = m["roe"]
+    s["roa"]              = m["roa"]
+    s["debt_equity"]      = None if (is_fin or is_util) else m["debt_equity"]
     s["quality"] = _wavg([
         (s["operating_margin"], 0.30),   # best cross-sector profitability signal
         (s["roe"],              0.28),   # best capital efficiency — separates great from good
@@ -205,10 +254,10 @@ def score_record(raw):
     ])
 
     # ── Valuation (15%) ───────────────────────────────────────────────────
-    s["peg_ratio"]   = _interp(raw.get("peg_ratio"),   A_PEG_INV)
-    s["forward_pe"]  = _interp(raw.get("forward_pe"),  A_FWD_PE_INV)
-    s["ev_ebitda"]   = _interp(raw.get("ev_ebitda"),   A_EV_INV)
-    s["price_sales"] = _interp(raw.get("price_sales"), A_PS_INV)
+    s["peg_ratio"]   = m["peg_ratio"]
+    s["forward_pe"]  = m["forward_pe"]
+    s["ev_ebitda"]   = m["ev_ebitda"]
+    s["price_sales"] = m["price_sales"]
     s["valuation"] = _wavg([
         (s["peg_ratio"],   0.42),   # best growth-adjusted metric
         (s["ev_ebitda"],   0.28),   # universal: works across capital structures
@@ -217,9 +266,9 @@ def score_record(raw):
     ])
 
     # ── Momentum (10%) ────────────────────────────────────────────────────
-    s["perf_52w"]       = _interp(raw.get("perf_52w"),       A_PERF_52W)
-    s["analyst_upside"] = _interp(raw.get("analyst_upside"), A_UPSIDE)
-    s["analyst_rec"]    = _interp(raw.get("analyst_rec"),    A_REC_INV)
+    s["perf_52w"]       = m["perf_52w"]
+    s["analyst_upside"] = m["analyst_upside"]
+    s["analyst_rec"]    = m["analyst_rec"]
     s["momentum"] = _wavg([
         (s["analyst_upside"], 0.42),   # forward-looking; analysts price in next 12m
         (s["perf_52w"],       0.38),   # trend confirmation
@@ -590,15 +639,15 @@ def main():
         return
 
     print(f"Reading {RAW_FILE}...")
-    raw_data = json.loads(raw_path.read_text())
+    raw_data = orjson.loads(raw_path.read_bytes())
     raws     = raw_data.get("stocks", [])
     print(f"  {len(raws)} stocks loaded")
 
     # Score + format every record
     records = []
-    for raw in raws:
+    for raw, metric_scores in zip(raws, score_metrics(raws)):
         try:
-            scored    = score_record(raw)
+            scored    = score_record(raw, metric_scores)
             formatted = format_record(scored)
             records.append(formatted)
         except Exception as e:
@@ -612,7 +661,8 @@ def main():
         "total":        len(records),
         "stocks":       records,
     }
-    Path(OUTPUT_FILE).write_text(json.dumps(out, indent=2, default=str))
+    Path(OUTPUT_FILE).write_bytes(
+        orjson.dumps(out, default=str, option=orjson.OPT_INDENT_2))
     print(f"Written {OUTPUT_FILE}  ({len(records)} stocks)")
 
     # Grade distribution summary
@@ -18,7 +18,7 @@ Pipeline:
 """
 
 import json
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timezone
 from pathlib import Path
 
@@ -26,30 +26,27 @@ import yfinance as yf
 
 PORTFOLIO_FILE = "portfolio.json"
 DATA_FILE      = "data.json"
+PRICE_WORKERS  = 5    # concurrent lookups — only ~25 held positions to fetch
 
-def fetch_prices(tickers):
-    """Fetch current prices for a list of tickers. Returns {ticker: price}."""
-    prices = {}
-    for symbol in tickers:
-        try:
-            tk   = yf.Ticker(symbol)
-            info = tk.info or {}
-            price = info.get("currentPrice") or info.get("regularMarketPrice")
-            if price:
-                prices[symbol] = float(price)
-            time.sleep(0.3)   # light delay — only fetching held positions
-        except Exception as e:
-            print(f"  WARNING: could not fetch price for {symbol}: {e}")
-    return prices
-
-def fetch_spy_price():
-    """Fetch current SPY price for benchmark update."""
+def _fetch_price(symbol):
+    """Fetch the current price for one ticker, or None if unavailable."""
     try:
-        info = yf.Ticker("SPY").info or {}
-        return float(info.get("currentPrice") or info.get("regularMarketPrice") or 0)
-    except Exception:
+        info  = yf.Ticker(symbol).info or {}
+        price = info.get("currentPrice") or info.get("regularMarketPrice")
+        return float(price) if price else None
+    except Exception as e:
+        print(f"  WARNING: could not fetch price for {symbol}: {e}")
         return None
 
+def fetch_prices(tickers):
+    """Fetch current prices for a list of tickers. Returns {ticker: price}.
+    Lookups run concurrently: each one is a single blocking HTTP round trip,
+    so the total wait is roughly the slowest lookup rather than the sum.
+    """
+    with ThreadPoolExecutor(max_workers=PRICE_WORKERS) as pool:
+        results = list(pool.map(_fetch_price, tickers))
+    return {t: p for t, p in zip(tickers, results) if p is not None}
+
 def update_portfolio_prices(portfolio, prices):
     """Update holding prices and recalculate portfolio value."""
     today_str = date.today().isoformat()
@@ -84,24 +81,15 @@ def update_portfolio_prices(portfolio, prices):
     portfolio["updated_at"]  = today_str
     return portfolio, updated
 
-def update_spy_history(portfolio, spy_price):
-    """Extend SPY benchmark history with today's value."""
-    if spy_price is None:
-        return portfolio
+def update_spy_history(portfolio):
+    """Rebuild SPY benchmark history through today from one history request.
+    The series is normalised to start_value on the portfolio start date, so
+    the latest close doubles as today's benchmark value — no separate SPY
+    quote lookup is needed.
+    """
     today_str   = date.today().isoformat()
     start_value = portfolio.get("start_value", 1_000_000.0)
-    spy_history = portfolio.get("spy_history", [])
-
-    # Get SPY price at portfolio start to normalise
-    start_spy = None
-    if spy_history:
-        # Back-calculate: first entry value = start_value (by construction)
-        # We need the raw SPY price at start — stored implicitly
-        # Simpler: just use the ratio approach from full SPY history in portfolio
-        pass
-
-    # If we have existing spy_history, extend it using yfinance full history
-    start_date = portfolio.get("start_date", today_str)
+    start_date  = portfolio.get("start_date", today_str)
     try:
         spy  = yf.Ticker("SPY")
         hist = spy.history(start=start_date, auto_adjust=True)
@@ -143,8 +131,7 @@ def main():
     portfolio, updated = update_portfolio_prices(portfolio, prices)
     print(f"  Updated {updated} positions")
 
-    spy_price = fetch_spy_price()
-    portfolio = update_spy_history(portfolio, spy_price)
+    portfolio = update_spy_history(portfolio)
 
     Path(PORTFOLIO_FILE).write_text(json.dumps(portfolio, indent=2, default=str))
 
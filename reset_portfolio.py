@@ -32,6 +32,7 @@ import json
 from datetime import date, datetime, timezone
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
@@ -178,31 +179,27 @@ def build_holdings_and_history(records, closes):
               f" {cost:>12,.0f}")
 
     # ── Daily portfolio value ─────────────────────────────────────────────
+    # Vectorised over the whole price matrix instead of looping day × holding:
+    # gaps are forward-filled with the most recent close (cost basis before
+    # the first one), each position counts only from its buy date onward,
+    # and shares × price is summed across holdings for every day at once.
     print(f"\n  Computing daily portfolio history...", flush=True)
 
-    history = []
-    all_dates = closes.index.tolist()
-
-    for day in all_dates:
-        mv = 0.0
-        for ticker, pos in holdings.items():
-            # Don't count a position before its buy date
-            if day < pos["bought_date"]:
-                continue
-            if ticker not in closes.columns:
-                continue
-            price_today = closes[ticker].get(day)
-            if price_today is None or (price_today != price_today):  # NaN check
-                # Forward-fill: use most recent known price
-                past = closes[ticker].loc[:day].dropna()
-                price_today = float(past.iloc[-1]) if not past.empty else pos["cost_basis"]
-            mv += pos["shares"] * float(price_today)
-
-        history.append({
-            "date":  day,
-            "value": round(mv + cash, 2),
-            "cash":  round(cash, 2),
-        })
+    held = list(holdings)
+    if held:
+        prices = closes[held].ffill().fillna(
+            {t: holdings[t]["cost_basis"] for t in held})
+        shares = np.array([holdings[t]["shares"] for t in held])
+        active = np.column_stack(
+            [closes.index >= holdings[t]["bought_date"] for t in held])
+        mv = np.where(active, prices.to_numpy() * shares, 0.0).sum(axis=1)
+    else:
+        mv = np.zeros(len(closes))
+
+    history = [
+        {"date": day, "value": round(float(v) + cash, 2), "cash": round(cash, 2)}
+        for day, v in zip(closes.index, mv)
+    ]
 
     print(f"  {len(history)} daily data points  "
           f"({history[0]['date']} -> {history[-1]['date']})")
@@ -9,22 +9,46 @@ Output:    raw_data.json  (this file),  data.json + portfolio.json (grader)
 
 import json
 import math
+import os
+import random
+import re
+import threading
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone, date
 from pathlib import Path
 
 import yfinance as yf
+from yfinance.exceptions import YFRateLimitError
 import pandas as pd
 import numpy as np
+import orjson
+from curl_cffi import requests as curl_requests
 
 # ─── Config ───────────────────────────────────────────────────────────────────
 OUTPUT_FILE     = "raw_data.json"
 PORTFOLIO_FILE  = "portfolio.json"
-DELAY_BETWEEN   = 1.2   # seconds between tickers (keep Yahoo rate limits happy)
+REQUEST_RATE    = 1.0   # ticker fetches started per second, across all workers
+REQUEST_BURST   = 4     # fetches allowed back-to-back before the rate applies
+MAX_WORKERS     = 8     # concurrent ticker fetches (pure I/O wait — threads overlap it)
 MAX_RETRIES     = 4
+BACKOFF_CAP     = 30    # seconds; ceiling for exponential retry backoff
+CACHE_DIR       = ".cache"
+CACHE_TTL       = 6 * 3600   # seconds a cached ticker record stays fresh (0 = off)
 PORTFOLIO_START = 1_000_000.0   # starting cash (used for SPY benchmark scaling)
 
+# One HTTP session shared by every yf.Ticker the scraper creates, so all
+# tickers reuse the same keep-alive connections (and TLS sessions) to Yahoo
+# instead of each Ticker negotiating its own.  curl_cffi keeps one handle per
+# worker thread, so it is safe to share across the thread pool.
+#
+# The Chrome impersonation profile already advertises compressed encodings
+# (gzip, deflate, br, zstd) and libcurl decodes them, so responses arrive
+# compressed without overriding Accept-Encoding — which would also break the
+# browser fingerprint yfinance relies on to avoid throttling.
+SESSION = curl_requests.Session(impersonate="chrome")
+
 # ─── Ticker universe ──────────────────────────────────────────────────────────
 
 SP500_TICKERS = [
@@ -125,30 +149,297 @@ def safe_pct(val, default=None):
         return default
     return round(v * 100, 2)
 
+def _as_float(val):
+    """safe() with a fast path for values that are already floats — the
+    statement helpers hand over floats, so they skip the float() round trip."""
+    if type(val) is float:
+        return val if math.isfinite(val) else None
+    return safe(val)
+
 def calc_growth(new_val, old_val):
-    n = safe(new_val)
-    o = safe(old_val)
+    """% change from old_val to new_val; None when either is missing or old is 0."""
+    n = _as_float(new_val)
+    o = _as_float(old_val)
     if n is None or o is None or o == 0:
         return None
     return round((n - o) / abs(o) * 100, 2)
 
 
+# ─── Statement helpers ────────────────────────────────────────────────────────
+# Module-level so they are built once, not re-created for every ticker.
+
+# Some tickers use formats Yahoo Finance doesn't recognise directly.
+YF_SYMBOLS = {"BF-B": "BF-B", "BRK-B": "BRK-B"}
+
+# Candidate row labels, ordered from most to least preferred.
+# Revenue covers non-standard names (AVGO: 'Net Revenue', KEYS: 'Net Revenues').
+REVENUE_ROWS    = ("Total Revenue", "Revenue", "Net Revenue",
+                   "Operating Revenue", "Total Net Revenue")
+EPS_ROWS        = ("Diluted EPS", "Basic EPS", "Basic And Diluted EPS",
+                   "EPS", "EPS (Diluted)", "Diluted Earnings Per Share",
+                   "Earnings Per Share", "EPS Diluted")
+NET_INCOME_ROWS = ("Net Income", "Net Income Common Stockholders",
+                   "Net Income Applicable To Common Shares")
+EQUITY_ROWS     = ("Stockholders Equity", "Common Stock Equity",
+                   "Total Equity Gross Minority Interest")
+DEBT_ROWS       = ("Total Debt",
+                   "Long Term Debt And Capital Lease Obligation",
+                   "Long Term Debt")
+
+# Income-statement fields located by row_index(): exact labels in preference
+# order, then a fuzzy pattern matched against each lower-cased label in
+# statement order.  Revenue's fuzzy pass skips "cost of revenue" rows.
+STATEMENT_FIELDS = {
+    "revenue":    (REVENUE_ROWS,    re.compile(r"^(?!.*cost).*revenue")),
+    "eps":        (EPS_ROWS,        re.compile(r"earnings per share")),
+    "net_income": (NET_INCOME_ROWS, None),
+}
+# Inverted lookup: exact label → [(field, preference rank), ...]
+_EXACT_FIELDS = {}
+for _field, (_names, _) in STATEMENT_FIELDS.items():
+    for _rank, _name in enumerate(_names):
+        _EXACT_FIELDS.setdefault(_name, []).append((_field, _rank))
+_FUZZY_FIELDS = [(f, pat) for f, (_, pat) in STATEMENT_FIELDS.items() if pat]
+
+def row_index(df):
+    """Candidate row labels per field, most preferred first.
+    One pass over the statement's rows buckets every label into the fields
+    it can serve, so each lookup afterwards is a short list walk instead of
+    a rescan of the whole index.
+    """
+    exact = {f: [] for f in STATEMENT_FIELDS}
+    fuzzy = {f: [] for f in STATEMENT_FIELDS}
+    for idx in df.index:
+        for field, rank in _EXACT_FIELDS.get(idx, ()):
+            exact[field].append((rank, idx))
+        il = str(idx).lower()
+        for field, pat in _FUZZY_FIELDS:
+            if pat.search(il):
+                fuzzy[field].append(idx)
+    return {f: [idx for _, idx in sorted(exact[f], key=lambda t: t[0])] + fuzzy[f]
+            for f in STATEMENT_FIELDS}
+
+def find_row(df, candidates):
+    """First candidate row that converts cleanly to float, else None."""
+    for idx in candidates:
+        try:
+            return df.loc[idx].astype(float)
+        except Exception:
+            pass
+    return None
+
+def get_rev_row(df, rows=None):
+    """Revenue row — explicit names first, then any row containing
+    "revenue" but not "cost".
+    """
+    if rows is None:
+        rows = row_index(df)
+    return find_row(df, rows["revenue"])
+
+def get_eps_row(df, rows=None):
+    """EPS row — explicit names, then any 'earnings per share' row, then
+    Net Income as a last resort (YoY% ≈ EPS% when shares are stable).
+    """
+    if rows is None:
+        rows = row_index(df)
+    row = find_row(df, rows["eps"])
+    if row is None:
+        row = find_row(df, rows["net_income"])
+    return row
+
+# ── Normalize timestamps: strip tz for safe naive/aware comparison ──
+def ts_naive(ts):
+    try:
+        return ts.tz_localize(None) if ts.tzinfo else ts
+    except Exception:
+        return ts
+
+# ── Safe scalar from Series ──
+def sv(series, i):
+    if i >= len(series):
+        return None
+    try:
+        f = float(series.iloc[i])
+        return None if (f != f) else f   # NaN → None
+    except Exception:
+        return None
+
+# ── Sum a slice, requiring ALL values present ──
+# (no NaN tolerance — partial sums vs full-year bases give
+#  false growth rates, which is worse than showing None)
+def full_sum(series, start, end):
+    sl = series.iloc[start:end]
+    if sl.isna().any():
+        return None
+    return float(sl.sum())
+
+# ── Most recent annual value from a period ending before `before` ──
+def prior_annual(a_row, a_cols, before):
+    for col_i, col_date in enumerate(a_cols):
+        if ts_naive(col_date) < before:
+            return sv(a_row, col_i)
+    return None
+
+def ttm_growth(q_row, nq, q_cols, a_row, a_cols):
+    """TTM growth % for one statement row (revenue or EPS).
+
+    Primary: 8 quarter comparison (TTM vs prior TTM).
+    Fallback: TTM vs annual — but ONLY the annual whose period-end date is
+    BEFORE our TTM window starts, to avoid comparing a fiscal year to itself
+    (the NVDA/BKNG/MCO bug).
+    """
+    if q_row is None or nq < 4:
+        return None
+    ttm = full_sum(q_row, 0, 4)
+    if ttm is None:
+        return None
+    growth = calc_growth(ttm, full_sum(q_row, 4, 8)) if nq >= 8 else None
+    if growth is None and a_row is not None:
+        ttm_start = ts_naive(q_cols[3])   # oldest quarter in TTM
+        growth = calc_growth(ttm, prior_annual(a_row, a_cols, ttm_start))
+    return growth
+
+def yoy_accel(q_row, nq, q_cols, a_row, a_cols):
+    """Acceleration (pp) for one statement row: Q0 YoY minus Q1 YoY growth.
+
+    Uses exact year-ago quarters when nq>=5/6; otherwise falls back to
+    annual/4.  Key fix: BOTH year-ago values use the SAME prior-year annual
+    (not annual[0] for one and annual[1] for the other).
+    """
+    if q_row is None or nq < 2:
+        return None
+    x0    = sv(q_row, 0)
+    x1    = sv(q_row, 1)
+    x0_ya = sv(q_row, 4) if nq >= 5 else None
+    x1_ya = sv(q_row, 5) if nq >= 6 else None
+
+    if (x0_ya is None or x1_ya is None) and a_row is not None:
+        # ONE prior-year annual: most recent before the oldest quarter we have
+        oldest_q = ts_naive(q_cols[min(3, nq - 1)])
+        prior_yr = prior_annual(a_row, a_cols, oldest_q)
+        # `is not None`, not truthiness — zero is a valid annual value for
+        # breakeven/charge-year companies (EIX, CF, GDDY).
+        if prior_yr is not None:
+            avg = prior_yr / 4
+            if x0_ya is None: x0_ya = avg
+            if x1_ya is None: x1_ya = avg
+
+    # Missing values and zero bases (None / 0.0) both rule out a YoY rate
+    if x0 is None or x1 is None or not x0_ya or not x1_ya:
+        return None
+    yoy0 = (x0 - x0_ya) / abs(x0_ya) * 100
+    yoy1 = (x1 - x1_ya) / abs(x1_ya) * 100
+    return round(yoy0 - yoy1, 2)
+
+def info_growth(raw_val):
+    """Info-level growth decimal → percent; near-zero sentinels become None."""
+    v = safe(raw_val)
+    if v is None or abs(v) < 0.0015:   # ±0.15% sentinel threshold
+        return None
+    return round(v * 100, 2)
+
+
+# ─── Rate limiting ────────────────────────────────────────────────────────────
+
+class RateLimiter:
+    """Token bucket shared by every worker thread.
+
+    Holds up to `burst` tokens, refilled at `rate` tokens per second;
+    acquire() blocks until one is available.  When Yahoo signals throttling,
+    penalize() drains the bucket and stops refills for `seconds`, so the whole
+    pool backs off instead of only the thread that got the 429.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate   = rate
+        self.burst  = burst
+        self.tokens = float(burst)
+        self._stamp = time.monotonic()   # refill clock; may sit in the future
+        self._lock  = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now > self._stamp:
+                    self.tokens = min(self.burst,
+                                      self.tokens + (now - self._stamp) * self.rate)
+                    self._stamp = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (self._stamp - now) + (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def penalize(self, seconds):
+        with self._lock:
+            self.tokens = 0.0
+            self._stamp = max(self._stamp, time.monotonic() + seconds)
+
+
+LIMITER = RateLimiter(REQUEST_RATE, REQUEST_BURST)
+
+
+class ThinInfoError(ValueError):
+    """Yahoo answered with a near-empty info dict — its usual soft throttle,
+    so it is handled like YFRateLimitError and backs off the whole pool."""
+
+
+# ─── On-disk cache ────────────────────────────────────────────────────────────
+# Successful per-ticker records are kept in CACHE_DIR/{symbol}.json so a rerun
+# within CACHE_TTL (a retry after a crash, a local dev iteration) skips the
+# network entirely for tickers already fetched.  Skips and errors are never
+# cached.
+
+def _cache_path(symbol):
+    return Path(CACHE_DIR) / f"{symbol}.json"
+
+def load_cached(symbol):
+    """Return the cached record for symbol if younger than CACHE_TTL, else None."""
+    if CACHE_TTL <= 0:
+        return None
+    try:
+        entry = json.loads(_cache_path(symbol).read_text())
+        if time.time() - entry["ts"] < CACHE_TTL:
+            return entry["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+def save_cached(symbol, record):
+    """Write record to the cache atomically (temp file + os.replace)."""
+    if CACHE_TTL <= 0:
+        return
+    path = _cache_path(symbol)
+    tmp  = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(exist_ok=True)
+        tmp.write_text(json.dumps({"ts": time.time(), "data": record}, default=str))
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"    {symbol:<8} cache write failed: {e}")
+
+
 # ─── Per-ticker fetch ─────────────────────────────────────────────────────────
 
 def fetch_ticker_data(symbol, require_min_cap=True):
-    # Some tickers use formats Yahoo Finance doesn't recognise directly.
-    yf_symbol = {"BF-B": "BF-B", "BRK-B": "BRK-B"}.get(symbol, symbol)
+    cached = load_cached(symbol)
+    if cached is not None:
+        return cached
+
+    yf_symbol = YF_SYMBOLS.get(symbol, symbol)
 
     for attempt in range(1, MAX_RETRIES + 1):
+        LIMITER.acquire()
         try:
-            tk   = yf.Ticker(yf_symbol)
+            tk   = yf.Ticker(yf_symbol, session=SESSION)
             info = tk.info or {}
 
             # A valid info dict has 30+ keys. Fewer than 10 means Yahoo returned
             # a minimal/empty response — almost always rate limiting or a transient
             # failure. Don't silently skip: raise so the retry loop can back off.
             if len(info) < 10:
-                raise ValueError(f"thin info dict ({len(info)} keys) — likely rate limited")
+                raise ThinInfoError(f"thin info dict ({len(info)} keys) — likely rate limited")
 
             market_cap = safe(info.get("marketCap"))
 
@@ -245,8 +536,7 @@ def fetch_ticker_data(symbol, require_min_cap=True):
                         _qi = _qi.sort_index(axis=1, ascending=False)
                         # TTM net income
                         _ni_row = None
-                        for _n in ["Net Income", "Net Income Common Stockholders",
-                                   "Net Income Applicable To Common Shares"]:
+                        for _n in NET_INCOME_ROWS:
                             if _n in _qi.index:
                                 _ni_row = _qi.loc[_n]
                                 break
@@ -257,8 +547,7 @@ def fetch_ticker_data(symbol, require_min_cap=True):
                                 _ttm_ni = float(_sl.sum())
                         # Most-recent equity
                         _eq = None
-                        for _en in ["Stockholders Equity", "Common Stock Equity",
-                                    "Total Equity Gross Minority Interest"]:
+                        for _en in EQUITY_ROWS:
                             if _en in _bs.index:
                                 try:
                                     _v = float(_bs.loc[_en].iloc[0])
@@ -294,9 +583,7 @@ def fetch_ticker_data(symbol, require_min_cap=True):
                     if _bs2 is not None and not _bs2.empty:
                         _bs2 = _bs2.sort_index(axis=1, ascending=False)
                         _debt = None
-                        for _dn in ["Total Debt",
-                                    "Long Term Debt And Capital Lease Obligation",
-                                    "Long Term Debt"]:
+                        for _dn in DEBT_ROWS:
                             if _dn in _bs2.index:
                                 try:
                                     _v = float(_bs2.loc[_dn].iloc[0])
@@ -306,8 +593,7 @@ def fetch_ticker_data(symbol, require_min_cap=True):
                                 except Exception:
                                     pass
                         _eq2 = None
-                        for _en2 in ["Stockholders Equity", "Common Stock Equity",
-                                     "Total Equity Gross Minority Interest"]:
+                        for _en2 in EQUITY_ROWS:
                             if _en2 in _bs2.index:
                                 try:
                                     _v = float(_bs2.loc[_en2].iloc[0])
@@ -327,14 +613,8 @@ def fetch_ticker_data(symbol, require_min_cap=True):
             # yfinance info.revenueGrowth/earningsGrowth = single-quarter YoY.
             # Treat 0.0 AND values within ±0.15% as missing — yfinance returns
             # near-zero floats as a sentinel for unavailable data on many tickers.
-            def _info_growth(raw_val):
-                v = safe(raw_val)
-                if v is None or abs(v) < 0.0015:   # ±0.15% sentinel threshold
-                    return None
-                return round(v * 100, 2)
-
-            rev_growth_info = _info_growth(info.get("revenueGrowth"))
-            eps_growth_info = _info_growth(info.get("earningsGrowth"))
+            rev_growth_info = info_growth(info.get("revenueGrowth"))
+            eps_growth_info = info_growth(info.get("earningsGrowth"))
 
             # ── Quarterly financials ───────────────────────────────────────
             rev_growth_ttm = None
@@ -349,213 +629,26 @@ def fetch_ticker_data(symbol, require_min_cap=True):
                 if q_inc is not None and not q_inc.empty:
                     q_inc = q_inc.sort_index(axis=1, ascending=False)
                     nq    = q_inc.shape[1]
-
-                    # ── Row finders ────────────────────────────────────────
-                    def get_rev_row(df):
-                        """Revenue row — explicit names first, then fuzzy match.
-                        Covers non-standard names (AVGO: 'Net Revenue', KEYS:
-                        'Net Revenues') while still excluding cost rows.
-                        """
-                        for n in ["Total Revenue", "Revenue", "Net Revenue",
-                                  "Operating Revenue", "Total Net Revenue"]:
-                            if n in df.index:
-                                try:
-                                    return df.loc[n].astype(float)
-                                except Exception:
-                                    pass
-                        # Fuzzy: any row containing "revenue" but not "cost"
-                        for idx in df.index:
-                            il = str(idx).lower()
-                            if "revenue" in il and "cost" not in il:
-                                try:
-                                    return df.loc[idx].astype(float)
-                                except Exception:
-                                    pass
-                        return None
-
-                    def get_eps_row(df):
-                        # Explicit EPS row names — ordered from most to least preferred
-                        for n in ["Diluted EPS", "Basic EPS", "Basic And Diluted EPS",
-                                  "EPS", "EPS (Diluted)", "Diluted Earnings Per Share",
-                                  "Earnings Per Share", "EPS Diluted"]:
-                            if n in df.index:
-                                try:
-                                    return df.loc[n].astype(float)
-                                except Exception:
-                                    pass
-                        # Fuzzy fallback: any row whose name contains 'earnings per share'
-                        for idx in df.index:
-                            il = str(idx).lower()
-                            if "earnings per share" in il:
-                                try:
-                                    return df.loc[idx].astype(float)
-                                except Exception:
-                                    pass
-                        # Last resort: Net Income (YoY% ≈ EPS% when shares are stable)
-                        for n in ["Net Income", "Net Income Common Stockholders",
-                                  "Net Income Applicable To Common Shares"]:
-                            if n in df.index:
-                                try:
-                                    return df.loc[n].astype(float)
-                                except Exception:
-                                    pass
-                        return None
-
-                    # ── Normalize timestamps: strip tz for safe naive/aware comparison ──
-                    def ts_naive(ts):
-                        try:
-                            return ts.tz_localize(None) if ts.tzinfo else ts
-                        except Exception:
-                            return ts
-
-                    # ── Safe scalar from Series ────────────────────────────
-                    def sv(series, i):
-                        if i >= len(series):
-                            return None
-                        try:
-                            f = float(series.iloc[i])
-                            return None if (f != f) else f   # NaN → None
-                        except Exception:
-                            return None
-
-                    # ── Sum a slice, requiring ALL values present ──────────
-                    # (no NaN tolerance — partial sums vs full-year bases give
-                    #  false growth rates, which is worse than showing None)
-                    def full_sum(series, start, end):
-                        sl = series.iloc[start:end]
-                        if sl.isna().any():
-                            return None
-                        return float(sl.sum())
-
-                    # ── Growth from two values, None-safe ─────────────────
-                    def pct_chg(new, old):
-                        if new is None or old is None or old == 0:
-                            return None
-                        return round((new - old) / abs(old) * 100, 2)
-
-                    rev_q = get_rev_row(q_inc)
-                    eps_q = get_eps_row(q_inc)
-
-                    # ── TTM revenue growth ─────────────────────────────────
-                    # Primary: 8 quarter comparison (TTM vs prior TTM)
-                    # Fallback: TTM vs annual — but ONLY use the annual whose
-                    # period-end date is BEFORE our TTM window starts, to avoid
-                    # comparing a fiscal year to itself (the NVDA/BKNG/MCO bug).
-                    if rev_q is not None and nq >= 4:
-                        ttm = full_sum(rev_q, 0, 4)
-                        if ttm is not None:
-                            if nq >= 8:
-                                prev = full_sum(rev_q, 4, 8)
-                                rev_growth_ttm = pct_chg(ttm, prev)
-
-                            if rev_growth_ttm is None and a_inc is not None \
-                                    and not a_inc.empty:
-                                a_s   = a_inc.sort_index(axis=1, ascending=False)
-                                rev_a = get_rev_row(a_s)
-                                if rev_a is not None:
-                                    # TTM ends at the most recent quarter date;
-                                    # TTM starts approximately 1 year before that.
-                                    ttm_end   = ts_naive(q_inc.columns[0])   # newest quarter date
-                                    ttm_start = ts_naive(q_inc.columns[3])   # oldest quarter in TTM
-
-                                    # Walk annual columns to find the first one
-                                    # whose date is strictly before ttm_start.
-                                    # This ensures we never compare TTM to a year
-                                    # that overlaps with our TTM window.
-                                    prior = None
-                                    for col_i, col_date in enumerate(a_s.columns):
-                                        if ts_naive(col_date) < ttm_start:
-                                            prior = sv(rev_a, col_i)
-                                            break
-
-                                    rev_growth_ttm = pct_chg(ttm, prior)
-
-                    # ── Revenue acceleration ───────────────────────────────
-                    # Q0 YoY vs Q1 YoY growth rate — need year-ago values.
-                    # Use exact quarterly ya when nq>=5/6; otherwise fall back
-                    # to annual/4.  Key fix: BOTH ya values use the SAME prior
-                    # year annual (not annual[0] for one and annual[1] for other).
-                    if rev_q is not None and nq >= 2:
-                        q0    = sv(rev_q, 0)
-                        q1    = sv(rev_q, 1)
-                        q0_ya = sv(rev_q, 4) if nq >= 5 else None
-                        q1_ya = sv(rev_q, 5) if nq >= 6 else None
-
-                        if (q0_ya is None or q1_ya is None)                                 and a_inc is not None and not a_inc.empty:
-                            a_s   = a_inc.sort_index(axis=1, ascending=False)
-                            rev_a = get_rev_row(a_s)
-                            if rev_a is not None:
-                                # Find ONE prior-year annual: most recent whose
-                                # date is before the oldest quarter we have
-                                oldest_q = ts_naive(q_inc.columns[min(3, nq - 1)])
-                                prior_yr = None
-                                for col_i, col_date in enumerate(a_s.columns):
-                                    if ts_naive(col_date) < oldest_q:
-                                        prior_yr = sv(rev_a, col_i)
-                                        break
-                                # Use `is not None` not truthiness — zero is a
-                                # valid annual revenue/EPS value (edge case) and
-                                # falsy check silently skips it (EIX, CF, GDDY).
-                                if prior_yr is not None:
-                                    avg = prior_yr / 4
-                                    if q0_ya is None: q0_ya = avg
-                                    if q1_ya is None: q1_ya = avg
-
-                        if all(v is not None for v in [q0, q1, q0_ya, q1_ya])                                 and q0_ya != 0 and q1_ya != 0:
-                            yoy0 = (q0 - q0_ya) / abs(q0_ya) * 100
-                            yoy1 = (q1 - q1_ya) / abs(q1_ya) * 100
-                            rev_accel = round(yoy0 - yoy1, 2)
-
-                    # ── EPS TTM growth ─────────────────────────────────────
-                    if eps_q is not None and nq >= 4:
-                        ttm_e = full_sum(eps_q, 0, 4)
-                        if ttm_e is not None:
-                            if nq >= 8:
-                                prev_e = full_sum(eps_q, 4, 8)
-                                eps_growth_ttm = pct_chg(ttm_e, prev_e)
-
-                            if eps_growth_ttm is None and a_inc is not None \
-                                    and not a_inc.empty:
-                                a_s   = a_inc.sort_index(axis=1, ascending=False)
-                                eps_a = get_eps_row(a_s)
-                                if eps_a is not None:
-                                    ttm_start = ts_naive(q_inc.columns[3])
-                                    prior_e   = None
-                                    for col_i, col_date in enumerate(a_s.columns):
-                                        if ts_naive(col_date) < ttm_start:
-                                            prior_e = sv(eps_a, col_i)
-                                            break
-                                    eps_growth_ttm = pct_chg(ttm_e, prior_e)
-
-                    # ── EPS acceleration ───────────────────────────────────
-                    # Same single-prior-year fix as rev_accel.
-                    if eps_q is not None and nq >= 2:
-                        e0    = sv(eps_q, 0)
-                        e1    = sv(eps_q, 1)
-                        e0_ya = sv(eps_q, 4) if nq >= 5 else None
-                        e1_ya = sv(eps_q, 5) if nq >= 6 else None
-
-                        if (e0_ya is None or e1_ya is None)                                 and a_inc is not None and not a_inc.empty:
-                            a_s   = a_inc.sort_index(axis=1, ascending=False)
-                            eps_a = get_eps_row(a_s)
-                            if eps_a is not None:
-                                oldest_q = ts_naive(q_inc.columns[min(3, nq - 1)])
-                                prior_yr_e = None
-                                for col_i, col_date in enumerate(a_s.columns):
-                                    if ts_naive(col_date) < oldest_q:
-                                        prior_yr_e = sv(eps_a, col_i)
-                                        break
-                                # Same fix: zero annual EPS is valid for
-                                # breakeven/charge-year companies (EIX, GDDY).
-                                if prior_yr_e is not None:
-                                    avg_e = prior_yr_e / 4
-                                    if e0_ya is None: e0_ya = avg_e
-                                    if e1_ya is None: e1_ya = avg_e
-
-                        if all(v is not None for v in [e0, e1, e0_ya, e1_ya])                                 and e0_ya != 0 and e1_ya != 0:
-                            yoy0 = (e0 - e0_ya) / abs(e0_ya) * 100
-                            yoy1 = (e1 - e1_ya) / abs(e1_ya) * 100
-                            eps_accel = round(yoy0 - yoy1, 2)
+                    q_cols = q_inc.columns
+
+                    # Annual statement is sorted and its rows located once,
+                    # then shared by the TTM and acceleration fallbacks.
+                    a_s = a_cols = rev_a = eps_a = None
+                    if a_inc is not None and not a_inc.empty:
+                        a_s    = a_inc.sort_index(axis=1, ascending=False)
+                        a_cols = a_s.columns
+                        a_rows = row_index(a_s)
+                        rev_a  = get_rev_row(a_s, a_rows)
+                        eps_a  = get_eps_row(a_s, a_rows)
+
+                    q_rows = row_index(q_inc)
+                    rev_q  = get_rev_row(q_inc, q_rows)
+                    eps_q  = get_eps_row(q_inc, q_rows)
+
+                    rev_growth_ttm = ttm_growth(rev_q, nq, q_cols, rev_a, a_cols)
+                    eps_growth_ttm = ttm_growth(eps_q, nq, q_cols, eps_a, a_cols)
+                    rev_accel      = yoy_accel(rev_q, nq, q_cols, rev_a, a_cols)
+                    eps_accel      = yoy_accel(eps_q, nq, q_cols, eps_a, a_cols)
 
             except Exception as e:
                 print(f"    [growth calc error {symbol}]: {e}")
@@ -642,7 +735,7 @@ def fetch_ticker_data(symbol, require_min_cap=True):
             except Exception:
                 pass
 
-            return {
+            record = {
                 "ticker":           symbol,
                 "name":             name,
                 "sector":           sector,
@@ -672,14 +765,20 @@ def fetch_ticker_data(symbol, require_min_cap=True):
                 "debt_equity":      debt_equity,
                 "next_earnings":    next_earnings,
             }
+            save_cached(symbol, record)
+            return record
 
         except Exception as e:
             if attempt < MAX_RETRIES:
-                wait = 2 ** attempt
-                print(f"retry({attempt})…", end=" ", flush=True)
+                # Exponential backoff with jitter so workers that failed
+                # together don't all retry in the same instant.
+                wait = min(BACKOFF_CAP, 2 ** attempt + random.random())
+                if isinstance(e, (YFRateLimitError, ThinInfoError)):
+                    LIMITER.penalize(wait)
+                print(f"    {symbol:<8} retry({attempt})…", flush=True)
                 time.sleep(wait)
             else:
-                print(f"ERROR: {e}")
+                print(f"    {symbol:<8} ERROR: {e}")
                 return None
 
 
@@ -698,7 +797,7 @@ def save_portfolio(portfolio):
 def get_sp500_history(start_date):
     """Fetch SPY price history from start_date to today for benchmark."""
     try:
-        spy = yf.Ticker("SPY")
+        spy = yf.Ticker("SPY", session=SESSION)
         hist = spy.history(start=start_date, auto_adjust=True)
         if hist.empty:
             return []
@@ -735,22 +834,28 @@ def main():
     records = []
     skipped = errors = 0
 
-    for i, (symbol, req_cap) in enumerate(tickers, 1):
-        print(f"  [{i:>3}/{len(tickers)}] {symbol:<8}", end=" ", flush=True)
-        try:
-            raw = fetch_ticker_data(symbol, require_min_cap=req_cap)
+    # Fetch concurrently; results are reported in completion order and the
+    # final list is re-sorted below, so ordering here doesn't matter.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = {pool.submit(fetch_ticker_data, symbol, req_cap): symbol
+                   for symbol, req_cap in tickers}
+        for i, fut in enumerate(as_completed(futures), 1):
+            symbol = futures[fut]
+            prefix = f"  [{i:>3}/{len(tickers)}] {symbol:<8}"
+            try:
+                raw = fut.result()
+            except Exception as e:
+                print(f"{prefix} ERROR: {e}")
+                errors += 1
+                continue
             if raw is None:
-                print("skip")
+                print(f"{prefix} skip")
                 skipped += 1
             else:
                 records.append(raw)
                 b = raw.get("market_cap_b")
                 cap_str = (f"${b/1000:.2f}T" if b and b >= 1000 else f"${b:.1f}B") if b else ""
-                print(f"✓ {raw['name'][:32]:<32} {cap_str:>8}")
-        except Exception as e:
-            print(f"ERROR: {e}")
-            errors += 1
-        time.sleep(DELAY_BETWEEN)
+                print(f"{prefix} ✓ {raw['name'][:32]:<32} {cap_str:>8}", flush=True)
 
     # Sort by market cap descending for readability
     records.sort(key=lambda x: -(x.get("market_cap_b") or 0))
@@ -761,7 +866,8 @@ def main():
         "total":        len(records),
         "stocks":       records,
     }
-    Path(OUTPUT_FILE).write_text(json.dumps(out, indent=2, default=str))
+    Path(OUTPUT_FILE).write_bytes(
+        orjson.dumps(out, default=str, option=orjson.OPT_INDENT_2))
 
     print(f"\n=== Done ===")
     print(f"  Stocks:  {len(records)} fetched, {skipped} skipped, {errors} errors")